@@ -1,4 +1,4 @@
-from app.domain.entities import Conversa, Mensagem, RoleMensagem
+from app.domain.entities import Conversa, Mensagem, RoleMensagem, PaginaBusca
 from app.domain.repositories import RepositorioConversa
 from app.domain.services import ProvedorIA
 import uuid
@@ -129,3 +129,20 @@ class ListarConversasUseCase:
 
     async def executar(self) -> list[Conversa]:
         return await self.repositorio.listar_todas()
+
+
+class BuscarConversasUseCase:
+    TAMANHO_MAXIMO = 100
+
+    def __init__(self, repositorio: RepositorioConversa):
+        self.repositorio = repositorio
+
+    async def executar(self, termo: str, pagina: int = 1, tamanho: int = 20) -> PaginaBusca:
+        termo = (termo or "").strip()
+        if not termo:
+            raise ValueError("Informe um termo de busca")
+        if pagina < 1:
+            raise ValueError("A página deve ser maior ou igual a 1")
+        if tamanho < 1 or tamanho > self.TAMANHO_MAXIMO:
+            raise ValueError(f"O tamanho da página deve estar entre 1 e {self.TAMANHO_MAXIMO}")
+        return await self.repositorio.buscar(termo, pagina, tamanho)
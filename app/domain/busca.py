@@ -0,0 +1,97 @@
+import re
+import unicodedata
+
+
+TAMANHO_TRECHO = 160
+LIMITE_TRECHOS = 3
+
+STOPWORDS = {
+    "a", "o", "as", "os", "um", "uma", "uns", "umas", "de", "do", "da", "dos", "das",
+    "e", "ou", "em", "no", "na", "nos", "nas", "por", "para", "com", "sem", "que",
+    "se", "ao", "aos", "the", "of", "and", "is", "it", "eh"
+}
+
+_PADRAO_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+_SUFIXOS = (
+    "mente", "ando", "endo", "indo", "oes", "aes", "ais", "eis", "ens", "ava", "ado", "ido",
+    "ar", "er", "ir", "am", "em", "ou", "os", "as", "es", "s", "a", "e", "o"
+)
+
+
+def _normalizar_caractere(caractere: str) -> str:
+    """Minúsculo e sem acento, sempre com exatamente um caractere de saída.
+
+    Caracteres que não se reduzem a uma única letra base (ligaduras como "ﬁ")
+    ficam como estão, só em minúsculo quando isso não muda o tamanho.
+    """
+    base = "".join(
+        c for c in unicodedata.normalize("NFKD", caractere) if not unicodedata.combining(c)
+    ).lower()
+    if len(base) == 1:
+        return base
+    minusculo = caractere.lower()
+    return minusculo if len(minusculo) == 1 else caractere
+
+
+def normalizar(texto: str) -> str:
+    """Normaliza caractere a caractere, de modo que os offsets batem com o texto original."""
+    return "".join(_normalizar_caractere(c) for c in texto)
+
+
+def tokenizar(texto: str) -> list[str]:
+    return [
+        token for token in _PADRAO_TOKEN.findall(normalizar(texto))
+        if len(token) > 1 and token not in STOPWORDS
+    ]
+
+
+def radical(termo: str) -> str:
+    """Corta uma flexão comum do português para casar variações como "drone"/"drones".
+
+    É bem mais simples que o stemmer do índice de texto do MongoDB, mas deixa o
+    índice em memória casando as mesmas variações mais comuns.
+    """
+    for sufixo in _SUFIXOS:
+        if termo.endswith(sufixo) and len(termo) - len(sufixo) >= 3:
+            return termo[:-len(sufixo)]
+    return termo
+
+
+def radicais(texto: str) -> list[str]:
+    """Tokens já reduzidos ao radical; é o que o índice em memória guarda e consulta."""
+    return [radical(token) for token in tokenizar(texto)]
+
+
+def extrair_trecho(texto: str, radicais: list[str], tamanho: int = TAMANHO_TRECHO) -> str | None:
+    """Recorta uma janela do texto em torno da primeira palavra que começa por algum dos radicais.
+
+    Os radicais vêm de `radicais`. Retorna None quando nenhum aparece.
+    """
+    if not texto or not radicais:
+        return None
+    padrao = re.compile(r"\b(" + "|".join(re.escape(r) for r in radicais) + r")")
+    match = padrao.search(normalizar(texto))
+    if not match:
+        return None
+    return _recortar(texto, match.start(), tamanho)
+
+
+def trecho_inicial(texto: str, tamanho: int = TAMANHO_TRECHO) -> str:
+    """Trecho do início do texto, usado quando o índice casou mas nenhum termo foi localizado."""
+    return _recortar(texto, 0, tamanho)
+
+
+def _recortar(texto: str, posicao: int, tamanho: int) -> str:
+    if len(texto) <= tamanho:
+        return texto
+    inicio = max(0, posicao - tamanho // 3)
+    fim = min(len(texto), inicio + tamanho)
+    inicio = max(0, fim - tamanho)
+    trecho = texto[inicio:fim].strip()
+    if inicio > 0:
+        trecho = "…" + trecho
+    if fim < len(texto):
+        trecho = trecho + "…"
+    return trecho
+
@@ -45,3 +45,53 @@ class Conversa:
             "criada_em": self.criada_em.isoformat(),
             "atualizada_em": self.atualizada_em.isoformat()
         }
+
+
+@dataclass
+class TrechoBusca:
+    campo: str
+    trecho: str
+    mensagem_id: str = ""
+    remetente: str = ""
+
+    def para_dict(self) -> dict:
+        return {
+            "campo": self.campo,
+            "trecho": self.trecho,
+            "mensagem_id": self.mensagem_id,
+            "remetente": self.remetente
+        }
+
+
+@dataclass
+class ResultadoBusca:
+    conversa_id: str
+    pontuacao: float
+    trechos: List[TrechoBusca] = field(default_factory=list)
+    atualizada_em: datetime = field(default_factory=datetime.now)
+
+    def para_dict(self) -> dict:
+        return {
+            "conversa_id": self.conversa_id,
+            "pontuacao": round(self.pontuacao, 4),
+            "trechos": [t.para_dict() for t in self.trechos],
+            "atualizada_em": self.atualizada_em.isoformat()
+        }
+
+
+@dataclass
+class PaginaBusca:
+    termo: str
+    pagina: int
+    tamanho: int
+    total: int
+    resultados: List[ResultadoBusca] = field(default_factory=list)
+
+    def para_dict(self) -> dict:
+        return {
+            "q": self.termo,
+            "pagina": self.pagina,
+            "tamanho": self.tamanho,
+            "total": self.total,
+            "resultados": [r.para_dict() for r in self.resultados]
+        }
@@ -1,6 +1,10 @@
 from abc import ABC, abstractmethod
 from typing import Optional
-from app.domain.entities import Conversa
+from app.domain.entities import Conversa, PaginaBusca
+
+
+class BuscaIndisponivel(Exception):
+    pass
 
 
 class RepositorioConversa(ABC):
@@ -20,3 +24,7 @@ class RepositorioConversa(ABC):
     @abstractmethod
     async def listar_todas(self) -> list[Conversa]:
         pass
+
+    @abstractmethod
+    async def buscar(self, termo: str, pagina: int = 1, tamanho: int = 20) -> PaginaBusca:
+        pass
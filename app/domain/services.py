@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from typing import AsyncGenerator
+from app.domain.entities import Conversa
 
 
 class ProvedorIA(ABC):
@@ -7,3 +8,23 @@ class ProvedorIA(ABC):
     @abstractmethod
     async def gerar_resposta_stream(self, mensagens: list[dict], teoria: str = "") -> AsyncGenerator[str, None]:
         pass
+
+
+class IndiceBusca(ABC):
+
+    @abstractmethod
+    def indexar(self, conversa: Conversa) -> None:
+        pass
+
+    @abstractmethod
+    def remover(self, conversa_id: str) -> None:
+        pass
+
+    @abstractmethod
+    def buscar(self, termos: list[str], limite: int) -> tuple[int, list[tuple[str, float, list[str | int]]]]:
+        """Retorna o total de conversas encontradas e as `limite` mais relevantes.
+
+        Cada item traz o id da conversa, a pontuação e os campos que casaram
+        ("teoria" ou o índice da mensagem), do mais para o menos relevante.
+        """
+        pass
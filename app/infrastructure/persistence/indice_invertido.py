@@ -0,0 +1,89 @@
+from app.domain.busca import radicais
+from app.domain.entities import Conversa
+from app.domain.services import IndiceBusca
+from collections import Counter, defaultdict
+import heapq
+import math
+
+
+class IndiceInvertidoMemoria(IndiceBusca):
+    """Índice invertido em memória com ranqueamento BM25.
+
+    Cada termo (já reduzido ao radical, ver `radicais`) aponta para as conversas
+    em que aparece e, dentro delas, para os campos ("teoria" ou índice da
+    mensagem) com a frequência do termo. A busca só percorre as listas dos
+    termos consultados, sem varrer o acervo.
+    """
+
+    PESO_TEORIA = 2.0
+    K1 = 1.2
+    B = 0.75
+
+    def __init__(self):
+        self._postagens: dict[str, dict[str, dict[str | int, int]]] = defaultdict(dict)
+        self._termos_por_conversa: dict[str, set[str]] = {}
+        self._tamanhos: dict[str, int] = {}
+        self._tamanho_total = 0
+
+    def indexar(self, conversa: Conversa) -> None:
+        self.remover(conversa.id)
+
+        campos: list[tuple[str | int, str]] = [("teoria", conversa.teoria)]
+        campos.extend((i, m.conteudo) for i, m in enumerate(conversa.mensagens))
+
+        termos: set[str] = set()
+        tamanho = 0
+        for campo, texto in campos:
+            frequencias = Counter(radicais(texto or ""))
+            tamanho += sum(frequencias.values())
+            for termo, tf in frequencias.items():
+                self._postagens[termo].setdefault(conversa.id, {})[campo] = tf
+                termos.add(termo)
+
+        self._termos_por_conversa[conversa.id] = termos
+        self._tamanhos[conversa.id] = tamanho
+        self._tamanho_total += tamanho
+
+    def remover(self, conversa_id: str) -> None:
+        termos = self._termos_por_conversa.pop(conversa_id, None)
+        if termos is None:
+            return
+        for termo in termos:
+            postagem = self._postagens[termo]
+            postagem.pop(conversa_id, None)
+            if not postagem:
+                del self._postagens[termo]
+        self._tamanho_total -= self._tamanhos.pop(conversa_id, 0)
+
+    def buscar(self, termos: list[str], limite: int) -> tuple[int, list[tuple[str, float, list[str | int]]]]:
+        total_conversas = len(self._tamanhos)
+        if not termos or total_conversas == 0:
+            return 0, []
+
+        media_tamanho = (self._tamanho_total / total_conversas) or 1.0
+        pontuacoes: dict[str, float] = defaultdict(float)
+        campos_por_conversa: dict[str, dict[str | int, float]] = defaultdict(lambda: defaultdict(float))
+
+        for termo in set(termos):
+            postagem = self._postagens.get(termo)
+            if not postagem:
+                continue
+            df = len(postagem)
+            idf = math.log(1 + (total_conversas - df + 0.5) / (df + 0.5))
+            for conversa_id, campos in postagem.items():
+                tf = sum(
+                    frequencia * (self.PESO_TEORIA if campo == "teoria" else 1.0)
+                    for campo, frequencia in campos.items()
+                )
+                normalizacao = self.K1 * (1 - self.B + self.B * self._tamanhos[conversa_id] / media_tamanho)
+                pontuacoes[conversa_id] += idf * tf * (self.K1 + 1) / (tf + normalizacao)
+                for campo, frequencia in campos.items():
+                    campos_por_conversa[conversa_id][campo] += idf * frequencia
+
+        melhores = heapq.nlargest(limite, pontuacoes.items(), key=lambda item: item[1])
+        resultados = []
+        for conversa_id, pontuacao in melhores:
+            campos = campos_por_conversa[conversa_id]
+            ordenados = sorted(campos, key=lambda c: campos[c], reverse=True)
+            resultados.append((conversa_id, pontuacao, ordenados))
+        return len(pontuacoes), resultados
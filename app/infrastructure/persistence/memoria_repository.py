@@ -0,0 +1,77 @@
+from app.domain.busca import LIMITE_TRECHOS, extrair_trecho, radicais
+from app.domain.entities import Conversa, PaginaBusca, ResultadoBusca, TrechoBusca
+from app.domain.repositories import RepositorioConversa
+from app.domain.services import IndiceBusca
+from app.infrastructure.persistence.indice_invertido import IndiceInvertidoMemoria
+from typing import Optional
+import copy
+
+
+class RepositorioConversaMemoria(RepositorioConversa):
+    """Repositório em memória para uso embarcado e em testes.
+
+    A busca é delegada a um `IndiceBusca` (por padrão o índice invertido em
+    memória), mantido em dia a cada criação ou atualização de conversa. As
+    conversas entram e saem como cópias, então o acervo e o índice só mudam
+    por `criar`/`atualizar`, como no MongoDB.
+    """
+
+    def __init__(self, indice: Optional[IndiceBusca] = None):
+        self._conversas: dict[str, Conversa] = {}
+        self.indice = indice or IndiceInvertidoMemoria()
+
+    async def criar(self, conversa: Conversa) -> None:
+        armazenada = copy.deepcopy(conversa)
+        self._conversas[conversa.id] = armazenada
+        self.indice.indexar(armazenada)
+
+    async def obter_por_id(self, id: str) -> Optional[Conversa]:
+        conversa = self._conversas.get(id)
+        return copy.deepcopy(conversa) if conversa else None
+
+    async def atualizar(self, conversa: Conversa) -> None:
+        if conversa.id not in self._conversas:
+            return
+        armazenada = copy.deepcopy(conversa)
+        self._conversas[conversa.id] = armazenada
+        self.indice.indexar(armazenada)
+
+    async def listar_todas(self) -> list[Conversa]:
+        return [copy.deepcopy(c) for c in self._conversas.values()]
+
+    async def buscar(self, termo: str, pagina: int = 1, tamanho: int = 20) -> PaginaBusca:
+        termos = radicais(termo)
+        inicio = (pagina - 1) * tamanho
+        total, encontrados = self.indice.buscar(termos, inicio + tamanho)
+
+        resultados = []
+        for conversa_id, pontuacao, campos in encontrados[inicio:]:
+            conversa = self._conversas[conversa_id]
+            resultados.append(ResultadoBusca(
+                conversa_id=conversa_id,
+                pontuacao=pontuacao,
+                trechos=self._extrair_trechos(conversa, campos, termos),
+                atualizada_em=conversa.atualizada_em
+            ))
+        return PaginaBusca(termo=termo, pagina=pagina, tamanho=tamanho, total=total, resultados=resultados)
+
+    def _extrair_trechos(self, conversa: Conversa, campos: list[str | int], termos: list[str]) -> list[TrechoBusca]:
+        trechos = []
+        for campo in campos:
+            if len(trechos) >= LIMITE_TRECHOS:
+                break
+            if campo == "teoria":
+                trecho = extrair_trecho(conversa.teoria, termos)
+                if trecho:
+                    trechos.append(TrechoBusca(campo="teoria", trecho=trecho))
+                continue
+            mensagem = conversa.mensagens[campo]
+            trecho = extrair_trecho(mensagem.conteudo, termos)
+            if trecho:
+                trechos.append(TrechoBusca(
+                    campo="mensagem",
+                    trecho=trecho,
+                    mensagem_id=mensagem.id,
+                    remetente=mensagem.remetente.value
+                ))
+        return trechos
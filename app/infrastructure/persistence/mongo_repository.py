@@ -1,9 +1,40 @@
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
-from app.domain.entities import Conversa, Mensagem, RoleMensagem
-from app.domain.repositories import RepositorioConversa
+from pymongo.errors import OperationFailure
+from app.domain.busca import LIMITE_TRECHOS, extrair_trecho, radical, trecho_inicial, tokenizar
+from app.domain.entities import Conversa, Mensagem, RoleMensagem, PaginaBusca, ResultadoBusca, TrechoBusca
+from app.domain.repositories import BuscaIndisponivel, RepositorioConversa
 from typing import Optional
 from datetime import datetime
+import asyncio
 import os
+import re
+
+
+_VARIANTES_ACENTO = {
+    "a": "aáàâãä",
+    "e": "eéèêë",
+    "i": "iíìîï",
+    "o": "oóòôõö",
+    "u": "uúùûü",
+    "c": "cç",
+    "n": "nñ",
+}
+
+
+def _padrao_regex(radicais: list[str]) -> str:
+    """Monta uma regex para o `$regexMatch` que casa qualquer um dos radicais ignorando acentos.
+
+    Ancorada no início de palavra, como o `\\b` de `extrair_trecho`, para que o banco
+    selecione as mesmas mensagens que depois viram trecho.
+    """
+    alternativas = []
+    for raiz in radicais:
+        partes = []
+        for c in raiz:
+            variantes = _VARIANTES_ACENTO.get(c)
+            partes.append(f"[{variantes}]" if variantes else re.escape(c))
+        alternativas.append("".join(partes))
+    return r"(^|[^\p{L}\p{N}_])(" + "|".join(alternativas) + ")"
 
 
 class ConexaoMongoDB:
@@ -25,10 +56,20 @@ class ConexaoMongoDB:
 
 
 class RepositorioConversaMongo(RepositorioConversa):
+    LIMITE_CONTAGEM = 1000
+
     def __init__(self, db: AsyncIOMotorDatabase):
         self.db = db
         self.colecao = db["conversas"]
 
+    async def criar_indices(self) -> None:
+        await self.colecao.create_index(
+            [("teoria", "text"), ("mensagens.conteudo", "text")],
+            name="busca_texto",
+            weights={"teoria": 2, "mensagens.conteudo": 1},
+            default_language="portuguese"
+        )
+
     async def criar(self, conversa: Conversa) -> None:
         documento = {
             "_id": conversa.id,
@@ -48,6 +89,7 @@ class RepositorioConversaMongo(RepositorioConversa):
     async def atualizar(self, conversa: Conversa) -> None:
         documento = {
             "mensagens": [self._serializar_mensagem(m) for m in conversa.mensagens],
+            "teoria": conversa.teoria,
             "atualizada_em": conversa.atualizada_em
         }
         await self.colecao.update_one({"_id": conversa.id}, {"$set": documento})
@@ -57,6 +99,103 @@ class RepositorioConversaMongo(RepositorioConversa):
         documentos = await cursor.to_list(None)
         return [self._mapear_para_entidade(doc) for doc in documentos]
 
+    async def buscar(self, termo: str, pagina: int = 1, tamanho: int = 20) -> PaginaBusca:
+        termos = tokenizar(termo)
+        if not termos:
+            return PaginaBusca(termo=termo, pagina=pagina, tamanho=tamanho, total=0)
+        raizes = [radical(t) for t in termos]
+
+        # Busca pelos termos já tokenizados: sem a sintaxe de negação (-palavra) e frase
+        # ("...") do $text, igual ao backend em memória e aos termos usados nos trechos.
+        filtro = {"$text": {"$search": " ".join(termos)}}
+        # Ranqueia só sobre _id/pontuação: o $sort seguido de $limit vira um top-k
+        # limitado à página, sem carregar as mensagens das conversas encontradas.
+        ranking = [
+            {"$match": filtro},
+            {"$project": {"pontuacao": {"$meta": "textScore"}, "atualizada_em": 1}},
+            {"$sort": {"pontuacao": -1, "atualizada_em": -1}},
+            {"$skip": (pagina - 1) * tamanho},
+            {"$limit": tamanho}
+        ]
+        try:
+            pagina_ids, total = await asyncio.gather(
+                self.colecao.aggregate(ranking).to_list(None),
+                self.colecao.count_documents(filtro, limit=self.LIMITE_CONTAGEM)
+            )
+        except OperationFailure as e:
+            print(f"[MONGO] ERRO na busca por texto: {e}")
+            raise BuscaIndisponivel("Busca indisponível: índice de texto não encontrado") from e
+        if not pagina_ids:
+            return PaginaBusca(termo=termo, pagina=pagina, tamanho=tamanho, total=total)
+
+        # Só as mensagens que contêm algum termo saem do banco, nunca a conversa inteira.
+        mensagens_casadas = {
+            "$slice": [
+                {
+                    "$filter": {
+                        "input": {"$ifNull": ["$mensagens", []]},
+                        "as": "m",
+                        "cond": {"$regexMatch": {"input": "$$m.conteudo", "regex": _padrao_regex(raizes), "options": "i"}}
+                    }
+                },
+                LIMITE_TRECHOS
+            ]
+        }
+        trechos_pipeline = [
+            {"$match": {"_id": {"$in": [doc["_id"] for doc in pagina_ids]}}},
+            {"$project": {
+                "teoria": 1,
+                "mensagens": mensagens_casadas,
+                "primeira_mensagem": {"$arrayElemAt": [{"$ifNull": ["$mensagens", []]}, 0]}
+            }}
+        ]
+        documentos = await self.colecao.aggregate(trechos_pipeline).to_list(None)
+        por_id = {doc["_id"]: doc for doc in documentos}
+
+        resultados = [
+            ResultadoBusca(
+                conversa_id=doc["_id"],
+                pontuacao=doc.get("pontuacao", 0.0),
+                trechos=self._extrair_trechos(por_id.get(doc["_id"], {}), raizes),
+                atualizada_em=doc["atualizada_em"]
+            )
+            for doc in pagina_ids
+        ]
+        return PaginaBusca(termo=termo, pagina=pagina, tamanho=tamanho, total=total, resultados=resultados)
+
+    def _extrair_trechos(self, documento: dict, raizes: list[str]) -> list[TrechoBusca]:
+        trechos = []
+        trecho_teoria = extrair_trecho(documento.get("teoria", ""), raizes)
+        if trecho_teoria:
+            trechos.append(TrechoBusca(campo="teoria", trecho=trecho_teoria))
+        for msg in documento.get("mensagens", []):
+            if len(trechos) >= LIMITE_TRECHOS:
+                break
+            trecho = extrair_trecho(msg["conteudo"], raizes)
+            if trecho:
+                trechos.append(TrechoBusca(
+                    campo="mensagem",
+                    trecho=trecho,
+                    mensagem_id=msg["id"],
+                    remetente=msg["remetente"]
+                ))
+        if not trechos:
+            trechos.append(self._trecho_reserva(documento))
+        return trechos
+
+    def _trecho_reserva(self, documento: dict) -> TrechoBusca:
+        # O stemmer do índice pode casar formas que o radical não localiza; nunca devolve um acerto sem trecho.
+        teoria = documento.get("teoria", "")
+        msg = documento.get("primeira_mensagem")
+        if teoria or not msg:
+            return TrechoBusca(campo="teoria", trecho=trecho_inicial(teoria))
+        return TrechoBusca(
+            campo="mensagem",
+            trecho=trecho_inicial(msg["conteudo"]),
+            mensagem_id=msg["id"],
+            remetente=msg["remetente"]
+        )
+
     def _mapear_para_entidade(self, documento: dict) -> Conversa:
         mensagens = [
             Mensagem(
@@ -1,4 +1,4 @@
-from fastapi import FastAPI, WebSocket, HTTPException, Depends
+from fastapi import FastAPI, WebSocket, HTTPException, Depends, Query
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from pydantic import BaseModel
@@ -8,19 +8,35 @@ import os
 import json
 
 from app.infrastructure.persistence.mongo_repository import ConexaoMongoDB, RepositorioConversaMongo
+from app.infrastructure.persistence.memoria_repository import RepositorioConversaMemoria
 from app.infrastructure.ai.provedor_claude import ProvedorIAClaude
-from app.domain.repositories import RepositorioConversa
+from app.domain.repositories import BuscaIndisponivel, RepositorioConversa
 from app.application.use_cases import (
     CriarConversaUseCase,
     ObtiveConversaUseCase,
     ProcessarMensagemUseCase,
-    ListarConversasUseCase
+    ListarConversasUseCase,
+    BuscarConversasUseCase
 )
 
 
+_repositorio_memoria: Optional[RepositorioConversaMemoria] = None
+
+
+def usa_memoria() -> bool:
+    return os.getenv("PERSISTENCIA", "mongo").lower() == "memoria"
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    await ConexaoMongoDB.conectar()
+    if usa_memoria():
+        yield
+        return
+    db = await ConexaoMongoDB.conectar()
+    try:
+        await RepositorioConversaMongo(db).criar_indices()
+    except Exception as e:
+        print(f"[API] ERRO ao criar índices de busca: {e}")
     yield
     await ConexaoMongoDB.desconectar()
 
@@ -37,6 +53,11 @@ app.add_middleware(
 
 
 async def obter_repositorio() -> RepositorioConversa:
+    global _repositorio_memoria
+    if usa_memoria():
+        if _repositorio_memoria is None:
+            _repositorio_memoria = RepositorioConversaMemoria()
+        return _repositorio_memoria
     db = await ConexaoMongoDB.conectar()
     return RepositorioConversaMongo(db)
 
@@ -52,6 +73,12 @@ async def root():
 
 @app.get("/health")
 async def health_check():
+    if usa_memoria():
+        return {
+            "status": "healthy",
+            "database": "memoria",
+            "api": "operational"
+        }
     try:
         db = await ConexaoMongoDB.conectar()
         await db.client.admin.command('ping')
@@ -77,6 +104,23 @@ async def criar_conversa(request: CriarConversaRequest = CriarConversaRequest(),
     return conversa.para_dict()
 
 
+@app.get("/conversas/busca")
+async def buscar_conversas(
+    q: str = Query(..., min_length=1),
+    pagina: int = Query(1, ge=1),
+    tamanho: int = Query(20, ge=1, le=BuscarConversasUseCase.TAMANHO_MAXIMO),
+    repositorio: RepositorioConversa = Depends(obter_repositorio)
+):
+    use_case = BuscarConversasUseCase(repositorio)
+    try:
+        resultado = await use_case.executar(q, pagina, tamanho)
+        return resultado.para_dict()
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except BuscaIndisponivel as e:
+        raise HTTPException(status_code=503, detail=str(e))
+
+
 @app.get("/conversas/{conversa_id}")
 async def obter_conversa(conversa_id: str, repositorio: RepositorioConversa = Depends(obter_repositorio)):
     use_case = ObtiveConversaUseCase(repositorio)
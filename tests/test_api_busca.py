@@ -0,0 +1,85 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("motor")
+
+from fastapi.testclient import TestClient
+
+from app.domain.entities import Mensagem, RoleMensagem
+from app.domain.repositories import BuscaIndisponivel
+from app.infrastructure.persistence.memoria_repository import RepositorioConversaMemoria
+from app.presentation import api
+
+
+@pytest.fixture
+def cliente(monkeypatch):
+    monkeypatch.setenv("PERSISTENCIA", "memoria")
+    monkeypatch.setattr(api, "_repositorio_memoria", None)
+    with TestClient(api.app) as cliente:
+        yield cliente
+    api.app.dependency_overrides.clear()
+
+
+def test_busca_nao_e_confundida_com_id_de_conversa(cliente):
+    cliente.post("/conversas", json={"teoria": "A Terra é plana"})
+
+    resposta = cliente.get("/conversas/busca", params={"q": "terra"})
+
+    assert resposta.status_code == 200
+    assert resposta.json()["total"] == 1
+
+
+def test_busca_devolve_pagina_com_trechos(cliente):
+    conversa_id = cliente.post("/conversas", json={"teoria": "Reptilianos existem"}).json()["id"]
+    cliente.post("/conversas", json={"teoria": "A lua é oca"})
+    repositorio = api._repositorio_memoria
+    conversa = asyncio.run(repositorio.obter_por_id(conversa_id))
+    conversa.adicionar_mensagem(Mensagem(conteudo="os drones vigiam", remetente=RoleMensagem.IA, id="m1"))
+    asyncio.run(repositorio.atualizar(conversa))
+
+    resposta = cliente.get("/conversas/busca", params={"q": "drone", "pagina": 1, "tamanho": 5})
+
+    assert resposta.status_code == 200
+    corpo = resposta.json()
+    assert {k: corpo[k] for k in ("q", "pagina", "tamanho", "total")} == {
+        "q": "drone", "pagina": 1, "tamanho": 5, "total": 1
+    }
+    [resultado] = corpo["resultados"]
+    assert resultado["conversa_id"] == conversa_id
+    assert set(resultado) == {"conversa_id", "pontuacao", "trechos", "atualizada_em"}
+    assert resultado["trechos"] == [
+        {"campo": "mensagem", "trecho": "os drones vigiam", "mensagem_id": "m1", "remetente": "ia"}
+    ]
+
+
+def test_busca_com_q_em_branco_retorna_400(cliente):
+    resposta = cliente.get("/conversas/busca", params={"q": "   "})
+
+    assert resposta.status_code == 400
+
+
+def test_busca_sem_q_e_com_tamanho_invalido_retorna_422(cliente):
+    assert cliente.get("/conversas/busca").status_code == 422
+    assert cliente.get("/conversas/busca", params={"q": "lua", "tamanho": 0}).status_code == 422
+
+
+def test_busca_indisponivel_retorna_503(cliente):
+    class RepositorioSemIndice(RepositorioConversaMemoria):
+        async def buscar(self, termo, pagina=1, tamanho=20):
+            raise BuscaIndisponivel("Busca indisponível: índice de texto não encontrado")
+
+    api.app.dependency_overrides[api.obter_repositorio] = lambda: RepositorioSemIndice()
+
+    resposta = cliente.get("/conversas/busca", params={"q": "lua"})
+
+    assert resposta.status_code == 503
+    assert "índice" in resposta.json()["detail"]
+
+
+def test_health_em_memoria_nao_depende_do_mongo(cliente):
+    resposta = cliente.get("/health")
+
+    assert resposta.json()["status"] == "healthy"
+    assert resposta.json()["database"] == "memoria"
@@ -0,0 +1,160 @@
+import asyncio
+
+import pytest
+
+from app.application.use_cases import BuscarConversasUseCase
+from app.domain.busca import TAMANHO_TRECHO, extrair_trecho, radicais, tokenizar
+from app.domain.entities import Conversa, Mensagem, RoleMensagem
+from app.infrastructure.persistence.memoria_repository import RepositorioConversaMemoria
+
+
+def _conversa(id: str, teoria: str, *mensagens: str) -> Conversa:
+    conversa = Conversa(id=id, teoria=teoria)
+    for i, conteudo in enumerate(mensagens):
+        conversa.adicionar_mensagem(Mensagem(conteudo=conteudo, remetente=RoleMensagem.USUARIO, id=f"{id}-{i}"))
+    return conversa
+
+
+def _repositorio(*conversas: Conversa) -> RepositorioConversaMemoria:
+    repositorio = RepositorioConversaMemoria()
+    for conversa in conversas:
+        asyncio.run(repositorio.criar(conversa))
+    return repositorio
+
+
+def _buscar(repositorio, termo: str, pagina: int = 1, tamanho: int = 20):
+    return asyncio.run(BuscarConversasUseCase(repositorio).executar(termo, pagina, tamanho))
+
+
+def test_ranqueia_teoria_acima_de_mensagem_com_o_mesmo_texto():
+    repositorio = _repositorio(
+        _conversa("mensagem", "olá mundo", "drones espiões"),
+        _conversa("teoria", "drones espiões", "olá mundo"),
+        _conversa("outra", "reptilianos", "nada a ver"),
+    )
+
+    resultado = _buscar(repositorio, "drones")
+
+    assert resultado.total == 2
+    assert [r.conversa_id for r in resultado.resultados] == ["teoria", "mensagem"]
+    assert resultado.resultados[0].pontuacao > resultado.resultados[1].pontuacao
+
+
+def test_ranqueia_termo_raro_acima_de_termo_comum():
+    repositorio = _repositorio(
+        _conversa("comum", "terra plana"),
+        _conversa("rara", "terra oca reptilianos"),
+        _conversa("outra", "terra redonda"),
+    )
+
+    resultado = _buscar(repositorio, "terra reptilianos")
+
+    assert resultado.total == 3
+    assert resultado.resultados[0].conversa_id == "rara"
+
+
+def test_pagina_alem_da_ultima_vem_vazia_com_total():
+    repositorio = _repositorio(*[_conversa(str(i), f"lua falsa {i}") for i in range(5)])
+
+    ultima = _buscar(repositorio, "lua", pagina=3, tamanho=2)
+    alem = _buscar(repositorio, "lua", pagina=4, tamanho=2)
+
+    assert ultima.total == 5
+    assert len(ultima.resultados) == 1
+    assert alem.total == 5
+    assert alem.resultados == []
+
+
+def test_paginas_nao_repetem_resultados():
+    repositorio = _repositorio(*[_conversa(str(i), f"lua falsa {i}") for i in range(5)])
+
+    ids = [
+        r.conversa_id
+        for pagina in (1, 2, 3)
+        for r in _buscar(repositorio, "lua", pagina=pagina, tamanho=2).resultados
+    ]
+
+    assert sorted(ids) == ["0", "1", "2", "3", "4"]
+
+
+def test_busca_ignora_acentos_na_consulta_e_no_texto():
+    repositorio = _repositorio(_conversa("1", "", "A ação do governo é secreta"))
+
+    for termo in ("acao", "AÇÃO", "Açao"):
+        resultado = _buscar(repositorio, termo)
+        assert resultado.total == 1
+        assert "ação" in resultado.resultados[0].trechos[0].trecho
+
+
+@pytest.mark.parametrize("consulta, texto", [
+    ("drone", "os drones vigiam"),
+    ("drones", "vi um drone ontem"),
+    ("vigiar", "os drones vigiam"),
+    ("reptiliano", "reptilianos existem"),
+])
+def test_busca_casa_variacoes_da_mesma_palavra(consulta, texto):
+    repositorio = _repositorio(_conversa("1", "", texto))
+
+    resultado = _buscar(repositorio, consulta)
+
+    assert resultado.total == 1
+    assert resultado.resultados[0].trechos[0].trecho == texto
+
+
+def test_consulta_so_com_stopwords_nao_retorna_nada():
+    repositorio = _repositorio(_conversa("1", "a terra de que se fala"))
+
+    resultado = _buscar(repositorio, "de que a")
+
+    assert resultado.total == 0
+    assert resultado.resultados == []
+
+
+def test_consulta_vazia_e_rejeitada():
+    with pytest.raises(ValueError):
+        _buscar(_repositorio(), "   ")
+
+
+def test_trecho_recorta_janela_em_volta_do_termo():
+    texto = "início " + "bla " * 100 + "o segredo dos reptilianos " + "fim " * 100
+
+    trecho = extrair_trecho(texto, radicais("reptilianos"))
+
+    assert "reptilianos" in trecho
+    assert trecho.startswith("…") and trecho.endswith("…")
+    assert len(trecho) <= TAMANHO_TRECHO + 2
+
+
+def test_trecho_alinha_com_texto_que_muda_de_tamanho_ao_minusculizar():
+    texto = "İ" * 100 + " terra " + "z " * 100
+
+    assert "terra" in extrair_trecho(texto, ["terra"])
+
+
+def test_normalizacao_nao_mutila_ligaduras():
+    assert tokenizar("ﬁnal Ação İstanbul") == ["ﬁnal", "acao", "istanbul"]
+
+
+def test_resultado_traz_apenas_trechos_que_casaram():
+    repositorio = _repositorio(_conversa("1", "teoria qualquer", "sem relação", "os drones vigiam", "outra coisa"))
+
+    trechos = _buscar(repositorio, "drones").resultados[0].trechos
+
+    assert [(t.campo, t.mensagem_id, t.trecho) for t in trechos] == [("mensagem", "1-1", "os drones vigiam")]
+
+
+def test_atualizar_reindexa_a_conversa():
+    repositorio = _repositorio(_conversa("1", "terra plana"))
+
+    conversa = asyncio.run(repositorio.obter_por_id("1"))
+    conversa.teoria = "lua oca"
+    conversa.adicionar_mensagem(Mensagem(conteudo="os drones vigiam", remetente=RoleMensagem.IA, id="m"))
+
+    assert _buscar(repositorio, "drones").total == 0
+    assert _buscar(repositorio, "plana").total == 1
+
+    asyncio.run(repositorio.atualizar(conversa))
+
+    assert _buscar(repositorio, "drones").total == 1
+    assert _buscar(repositorio, "lua").total == 1
+    assert _buscar(repositorio, "plana").total == 0